@@ -1,29 +1,56 @@
-import json
+import dataclasses
 import logging
 import os
 import re
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 logger = logging.getLogger(__name__)
 
-def read_urls_from_file(path: str) -> List[str]:
+def read_urls_from_file(path: str, unique: bool = True) -> List[str]:
     """
     Read input URLs from a text file.
 
-    Lines starting with '#' or empty lines are ignored.
+    Lines starting with '#' or empty lines are ignored. With `unique`,
+    duplicate URLs are dropped while preserving their first-seen order.
     """
     if not os.path.exists(path):
         logger.warning("Input file %s does not exist.", path)
         return []
 
-    urls: List[str] = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            raw = line.strip()
-            if not raw or raw.startswith("#"):
-                continue
-            urls.append(raw)
-    return urls
+    # Filter (and dedupe) the raw lines, then decode only the URLs that are kept
+    stripped = (line.strip() for line in Path(path).read_bytes().splitlines())
+    kept: Iterable[bytes] = (
+        raw for raw in stripped if raw and not raw.startswith(b"#")
+    )
+    if unique:
+        kept = dict.fromkeys(kept)
+    return [raw.decode("utf-8") for raw in kept]
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different spellings of the same page compare
+    equal: lower-case scheme and host, sorted query parameters without utm_*
+    tracking keys, no fragment and no trailing slash.
+    """
+    parts = urlsplit(url)
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+        )
+    )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            query,
+            "",
+        )
+    )
 
 def ensure_directory(path: str) -> None:
     """
@@ -46,6 +73,10 @@ def clean_text(value: Optional[str]) -> Optional[str]:
     value = value.strip()
     if not value:
         return None
+    # Fast path: isprintable() is False for every whitespace character except
+    # the ASCII space, so this rules out anything the regex would rewrite.
+    if "  " not in value and value.isprintable():
+        return value
     value = _whitespace_re.sub(" ", value)
     return value
 
@@ -54,6 +85,9 @@ _currency_re = re.compile(
     re.UNICODE,
 )
 
+# Map common currency symbols to ISO-ish codes
+_currency_symbols = {"$": "USD", "€": "EUR", "£": "GBP"}
+
 def extract_currency_amount(raw: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
     """
     Extract numeric amount and currency from a string such as '5,000,000 USD' or '$5,000,000'.
@@ -70,10 +104,7 @@ def extract_currency_amount(raw: Optional[str]) -> Tuple[Optional[float], Option
         amount = None
 
     currency = match.group("currency")
-    if currency in ("$", "€", "£"):
-        # Map common symbols to ISO-ish codes
-        symbol_map = {"$": "USD", "€": "EUR", "£": "GBP"}
-        currency = symbol_map.get(currency, currency)
+    currency = _currency_symbols.get(currency, currency)
     return amount, currency
 
 def parse_int_safe(raw: Any) -> Optional[int]:
@@ -85,11 +116,28 @@ def parse_int_safe(raw: Any) -> Optional[int]:
     if isinstance(raw, int):
         return raw
     try:
-        return int(str(raw).replace(",", "").strip())
+        # int() already ignores surrounding whitespace
+        return int(str(raw).replace(",", ""))
     except (ValueError, TypeError):
         logger.debug("Failed to parse int from %r", raw)
         return None
 
+def coerce_ints(data: Dict[str, Any], keys: Iterable[str]) -> Dict[str, Optional[int]]:
+    """
+    Parse several integer fields of a mapping in one pass.
+
+    Values that are already None or int are passed through; anything else
+    goes through parse_int_safe.
+    """
+    result: Dict[str, Optional[int]] = {}
+    for key in keys:
+        value = data.get(key)
+        if value is None or type(value) is int:
+            result[key] = value
+        else:
+            result[key] = parse_int_safe(value)
+    return result
+
 def parse_float_safe(raw: Any) -> Optional[float]:
     """
     Safely parse a float from raw input.
@@ -99,7 +147,8 @@ def parse_float_safe(raw: Any) -> Optional[float]:
     if isinstance(raw, (int, float)):
         return float(raw)
     try:
-        return float(str(raw).replace(",", "").strip())
+        # float() already ignores surrounding whitespace
+        return float(str(raw).replace(",", ""))
     except (ValueError, TypeError):
         logger.debug("Failed to parse float from %r", raw)
         return None
@@ -120,25 +169,28 @@ def merge_dicts(primary: Dict[str, Any], secondary: Dict[str, Any]) -> Dict[str,
     Merge two dictionaries, preferring non-null values from primary.
     Secondary provides only fields that are missing or null in primary.
     """
-    result: Dict[str, Any] = dict(primary)
-    for key, value in secondary.items():
-        if key not in result or result[key] is None:
+    result: Dict[str, Any] = dict(secondary)
+    for key, value in primary.items():
+        if value is not None or key not in result:
             result[key] = value
     return result
 
 def to_serializable(obj: Any) -> Any:
     """
     Convert non-serializable objects to JSON-serializable forms.
+
+    Containers are returned as-is, so this is meant to be passed as the
+    ``default`` hook of a JSON encoder, which recurses into them itself.
     """
-    try:
-        json.dumps(obj)
+    if obj is None or isinstance(obj, (str, int, float, bool, list, tuple, dict)):
         return obj
-    except TypeError:
-        if isinstance(obj, set):
-            return list(obj)
-        if hasattr(obj, "__dict__"):
-            return obj.__dict__
-        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
 
 def normalize_list(value: Any) -> List[Any]:
     """
@@ -1,14 +1,15 @@
-import json
 import logging
 import re
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 
 from .data_utils import (
     clean_text,
+    coerce_ints,
     extract_currency_amount,
     merge_dicts,
     normalize_list,
@@ -18,23 +19,82 @@ from .data_utils import (
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+_ld_json_re = re.compile(
+    r"<script[^>]+type=[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+_ld_json_bytes_re = re.compile(
+    _ld_json_re.pattern.encode(), re.DOTALL | re.IGNORECASE
+)
+_http_re = re.compile(r"^https?://", re.I)
+# Page text is joined with newlines between text nodes; the phone pattern
+# allows any whitespace but a newline, so a match never spans two elements
+_phone_re = re.compile(r"\+?\d(?:[\d().-]|[^\S\n]){6,}")
+# "5,000 employees" or "Employee count: 5,000"; the number-first form stays
+# within one text node so a preceding cell's number is never picked up
+_employees_count_re = re.compile(
+    r"(\d[\d,]*)[^\S\n]*employees|(?:employees|employee count)\W{0,3}(\d[\d,]*)",
+    re.I,
+)
+_trailing_id_re = re.compile(r"/(\d+)$")
+_tail_id_re = re.compile(r"(\d+)$")
+
+# Selectors tried in order for the headquarters fallback.
+_ADDRESS_SELECTORS = (
+    "[data-qa='address']",
+    ".address",
+    ".hq",
+    ".headquarters",
+)
+_NON_TEXT_TAGS = ["script", "style"]
+
+# Keys that _parse_html_fallbacks can contribute to the merged record.
+_FALLBACK_KEYS = (
+    "name",
+    "description",
+    "website",
+    "phone_number",
+    "industry",
+    "headquarters",
+    "employees",
+)
+
+# Integer-valued record fields, coerced together in parse_company.
+_INT_KEYS = (
+    "employees",
+    "funding_rounds",
+    "total_employees",
+    "c_level_employees",
+    "vp_level_employees",
+    "director_level_employees",
+    "manager_level_employees",
+    "non_manager_employees",
+    "top_contacts",
+)
+
+def _slots_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Shallow field dict for a slotted dataclass instance, in field order.
+    """
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+@dataclass(slots=True)
 class LeadershipProfile:
     name: Optional[str]
     title: Optional[str]
     url: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class TechStackItem:
     company_name: Optional[str]
     tech_name: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     title: Optional[str]
     url: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class CompanyRecord:
     url: str
     id: Optional[str]
@@ -74,11 +134,13 @@ class CompanyRecord:
     news_and_media: List[NewsItem]
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        # Convert nested dataclasses
-        data["leadership"] = [asdict(item) for item in self.leadership]
-        data["tech_stack"] = [asdict(item) for item in self.tech_stack]
-        data["news_and_media"] = [asdict(item) for item in self.news_and_media]
+        data = _slots_to_dict(self)
+        # Convert nested dataclasses; they only hold scalars, so no recursion is needed
+        data["leadership"] = [_slots_to_dict(item) for item in self.leadership]
+        data["tech_stack"] = [_slots_to_dict(item) for item in self.tech_stack]
+        data["news_and_media"] = [
+            _slots_to_dict(item) for item in self.news_and_media
+        ]
         return data
 
 class ZoomInfoCompanyParser:
@@ -87,17 +149,27 @@ class ZoomInfoCompanyParser:
     The implementation uses a combination of JSON-LD, meta tags, and heuristic CSS selectors.
     """
 
-    def parse_company(self, html: str, url: str) -> Dict[str, Any]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse_company(self, html: Union[str, bytes], url: str) -> Dict[str, Any]:
+        """
+        Parse a company page. `html` may be the raw UTF-8 response body, in
+        which case it is only decoded if the HTML fallbacks need a DOM.
+        """
         logger.debug("Parsing company page for %s", url)
 
-        ld_json_data = self._extract_ld_json(soup)
+        ld_json_data = self._extract_ld_json(html)
         logger.debug("Extracted JSON-LD payload: %s", ld_json_data)
 
         base_data = self._parse_from_ld_json(ld_json_data)
-        fallback_data = self._parse_html_fallbacks(soup)
+
+        # The DOM is only built when JSON-LD leaves fields for the fallbacks to fill.
+        fallback_data: Dict[str, Any] = {}
+        if any(base_data.get(key) is None for key in _FALLBACK_KEYS):
+            fallback_data = self._parse_html_fallbacks(LexborHTMLParser(html))
 
         merged = merge_dicts(base_data, fallback_data)
+        ints = coerce_ints(merged, _INT_KEYS)
+        if "total_employees" not in merged:
+            ints["total_employees"] = ints["employees"]
 
         company = CompanyRecord(
             url=url,
@@ -108,14 +180,14 @@ class ZoomInfoCompanyParser:
             revenue_currency=merged.get("revenue_currency"),
             stock_symbol=clean_text(merged.get("stock_symbol")),
             website=clean_text(merged.get("website")),
-            employees=parse_int_safe(merged.get("employees")),
+            employees=ints["employees"],
             industry=[i for i in normalize_list(merged.get("industry")) if i],
             headquarters=clean_text(merged.get("headquarters")),
             phone_number=clean_text(merged.get("phone_number")),
             total_funding_amount=merged.get("total_funding_amount"),
             most_recent_funding_amount=merged.get("most_recent_funding_amount"),
             funding_currency=merged.get("funding_currency"),
-            funding_rounds=parse_int_safe(merged.get("funding_rounds")),
+            funding_rounds=ints["funding_rounds"],
             leadership=self._parse_leadership(merged.get("leadership")),
             popular_searches=[
                 s for s in normalize_list(merged.get("popular_searches")) if s
@@ -127,21 +199,13 @@ class ZoomInfoCompanyParser:
                 )
                 if s
             ],
-            total_employees=parse_int_safe(
-                merged.get("total_employees", merged.get("employees"))
-            ),
-            c_level_employees=parse_int_safe(merged.get("c_level_employees")),
-            vp_level_employees=parse_int_safe(merged.get("vp_level_employees")),
-            director_level_employees=parse_int_safe(
-                merged.get("director_level_employees")
-            ),
-            manager_level_employees=parse_int_safe(
-                merged.get("manager_level_employees")
-            ),
-            non_manager_employees=parse_int_safe(
-                merged.get("non_manager_employees")
-            ),
-            top_contacts=parse_int_safe(merged.get("top_contacts")),
+            total_employees=ints["total_employees"],
+            c_level_employees=ints["c_level_employees"],
+            vp_level_employees=ints["vp_level_employees"],
+            director_level_employees=ints["director_level_employees"],
+            manager_level_employees=ints["manager_level_employees"],
+            non_manager_employees=ints["non_manager_employees"],
+            top_contacts=ints["top_contacts"],
             org_chart=normalize_list(merged.get("org_chart")),
             social_media=[
                 s for s in normalize_list(merged.get("social_media")) if s
@@ -168,15 +232,22 @@ class ZoomInfoCompanyParser:
 
     # JSON-LD and HTML helpers
 
-    def _extract_ld_json(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_ld_json(self, html: Union[str, bytes]) -> Dict[str, Any]:
         """
-        Extract the most relevant JSON-LD organization payload, if present.
+        Extract the first JSON-LD organization payload, if present.
+        Script blocks are located by scanning the raw HTML, so no DOM is needed.
         """
-        scripts = soup.find_all("script", type="application/ld+json")
-        best: Dict[str, Any] = {}
-        for script in scripts:
+        if isinstance(html, bytes):
+            pattern, markers = _ld_json_bytes_re, (b'"Organization"', b'"Corporation"')
+        else:
+            pattern, markers = _ld_json_re, ('"Organization"', '"Corporation"')
+        for match in pattern.finditer(html):
+            body = match.group(1)
+            # Skip decoding blocks (breadcrumbs, web page, ...) that cannot match
+            if markers[0] not in body and markers[1] not in body:
+                continue
             try:
-                data = json.loads(script.string or "")
+                data = orjson.loads(body)
             except Exception:  # noqa: BLE001
                 continue
 
@@ -189,8 +260,8 @@ class ZoomInfoCompanyParser:
                 if not isinstance(candidate, dict):
                     continue
                 if candidate.get("@type") in ("Organization", "Corporation"):
-                    best = candidate
-        return best
+                    return candidate
+        return {}
 
     def _parse_from_ld_json(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -251,7 +322,7 @@ class ZoomInfoCompanyParser:
 
         return result
 
-    def _parse_html_fallbacks(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _parse_html_fallbacks(self, tree: LexborHTMLParser) -> Dict[str, Any]:
         """
         Fallback extraction using meta tags and heuristic selectors.
         This keeps the scraper functional even if JSON-LD is missing.
@@ -259,57 +330,54 @@ class ZoomInfoCompanyParser:
         result: Dict[str, Any] = {}
 
         # Title / name
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            result["name"] = og_title["content"]
+        og_title = tree.css_first('meta[property="og:title"]')
+        if og_title and og_title.attributes.get("content"):
+            result["name"] = og_title.attributes["content"]
 
         # Description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            result["description"] = meta_desc["content"]
+        meta_desc = tree.css_first('meta[name="description"]')
+        if meta_desc and meta_desc.attributes.get("content"):
+            result["description"] = meta_desc.attributes["content"]
 
         # Website from links
-        website_link = soup.find("a", href=re.compile(r"^https?://", re.I))
-        if website_link and website_link.get("href"):
-            result["website"] = website_link["href"]
+        for link in tree.css("a[href]"):
+            href = link.attributes.get("href")
+            if href and _http_re.search(href):
+                result["website"] = href
+                break
+
+        # Free-text heuristics run one regex search over the visible page text
+        tree.strip_tags(_NON_TEXT_TAGS)
+        page_text = tree.root.text(separator="\n") if tree.root is not None else ""
 
         # Phone number heuristic
-        phone = soup.find(string=re.compile(r"\+?\d[\d\s().-]{6,}"))
+        phone = _phone_re.search(page_text)
         if phone:
-            result["phone_number"] = phone.strip()
+            result["phone_number"] = phone.group(0).strip()
 
         # Industry from labels or chips
-        industry_tags = soup.select("[data-qa='industry'], .industry, .industries")
+        industry_tags = tree.css("[data-qa='industry'], .industry, .industries")
         industries: List[str] = []
         for tag in industry_tags:
-            text = tag.get_text(" ", strip=True)
+            text = tag.text(separator=" ", strip=True)
             if text:
                 industries.append(text)
         if industries:
             result["industry"] = industries
 
         # Headquarters / address
-        address_selectors = [
-            "[data-qa='address']",
-            ".address",
-            ".hq",
-            ".headquarters",
-        ]
-        for sel in address_selectors:
-            node = soup.select_one(sel)
+        for sel in _ADDRESS_SELECTORS:
+            node = tree.css_first(sel)
             if node:
-                result["headquarters"] = node.get_text(" ", strip=True)
+                result["headquarters"] = node.text(separator=" ", strip=True)
                 break
 
         # Employees
-        employees_text_nodes = soup.find_all(
-            string=re.compile(r"(employees|employee count)", re.I)
-        )
-        for node in employees_text_nodes:
-            m = re.search(r"([\d,]+)", node)
-            if m:
-                result["employees"] = parse_int_safe(m.group(1))
-                break
+        employees = _employees_count_re.search(page_text)
+        if employees:
+            result["employees"] = parse_int_safe(
+                employees.group(1) or employees.group(2)
+            )
 
         return result
 
@@ -321,59 +389,57 @@ class ZoomInfoCompanyParser:
         ZoomInfo URLs often end with a numeric ID.
         """
         if ld_json.get("@id"):
-            m = re.search(r"/(\d+)$", str(ld_json["@id"]))
+            m = _trailing_id_re.search(str(ld_json["@id"]))
             if m:
                 return m.group(1)
 
         parsed = urlparse(url)
         tail = parsed.path.rstrip("/").split("/")[-1]
-        m = re.search(r"(\d+)$", tail)
+        m = _tail_id_re.search(tail)
         if m:
             return m.group(1)
         return None
 
     def _parse_leadership(self, raw: Any) -> List[LeadershipProfile]:
-        profiles: List[LeadershipProfile] = []
-        if isinstance(raw, list):
-            for item in raw:
-                if not isinstance(item, dict):
-                    continue
-                profiles.append(
-                    LeadershipProfile(
-                        name=clean_text(item.get("name")),
-                        title=clean_text(item.get("title")),
-                        url=clean_text(item.get("url")),
-                    )
-                )
-        return profiles
+        if not isinstance(raw, list):
+            return []
+        # Local aliases keep the per-item lookups out of the global namespace
+        ct, get = clean_text, dict.get
+        return [
+            LeadershipProfile(
+                name=ct(get(item, "name")),
+                title=ct(get(item, "title")),
+                url=ct(get(item, "url")),
+            )
+            for item in raw
+            if isinstance(item, dict)
+        ]
 
     def _parse_tech_stack(self, raw: Any) -> List[TechStackItem]:
-        items: List[TechStackItem] = []
-        if isinstance(raw, list):
-            for item in raw:
-                if not isinstance(item, dict):
-                    continue
-                items.append(
-                    TechStackItem(
-                        company_name=clean_text(item.get("company_name")),
-                        tech_name=clean_text(item.get("tech_name")),
-                    )
-                )
-        return items
+        if not isinstance(raw, list):
+            return []
+        ct, get = clean_text, dict.get
+        return [
+            TechStackItem(
+                company_name=ct(get(item, "company_name")),
+                tech_name=ct(get(item, "tech_name")),
+            )
+            for item in raw
+            if isinstance(item, dict)
+        ]
 
     def _parse_news_items(self, raw: Any) -> List[NewsItem]:
-        items: List[NewsItem] = []
-        if isinstance(raw, list):
-            for item in raw:
-                if not isinstance(item, dict):
-                    continue
-                items.append(
-                    NewsItem(
-                        title=clean_text(item.get("title")),
-                        url=clean_text(item.get("url")),
-                    )
-                )
-        return items
+        if not isinstance(raw, list):
+            return []
+        ct, get = clean_text, dict.get
+        return [
+            NewsItem(
+                title=ct(get(item, "title")),
+                url=ct(get(item, "url")),
+            )
+            for item in raw
+            if isinstance(item, dict)
+        ]
 
     @staticmethod
     def _parse_float_or_none(value: Any) -> Optional[float]:
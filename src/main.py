@@ -1,19 +1,50 @@
 import argparse
 import json
 import logging
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
-
-# Ensure local src modules can be imported when running "python src/main.py"
-CURRENT_FILE = Path(__file__).resolve()
-SRC_DIR = CURRENT_FILE.parent
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from extractors.zoominfo_parser import ZoomInfoCompanyScraper  # type: ignore  # noqa: E402
-from extractors.utils_data import load_settings, get_logger  # type: ignore  # noqa: E402
-from outputs.json_exporter import JSONExporter  # type: ignore  # noqa: E402
+from types import MappingProxyType
+from typing import List, Any, Mapping
+
+from .extractors.data_utils import read_urls_from_file
+from .extractors.zoominfo_parser import ZoomInfoCompanyScraper
+from .extractors.utils_data import load_settings, get_logger
+from .outputs.json_exporter import JSONExporter
+
+# Package module; note it does not import yet: ZoomInfoCompanyScraper is not
+# defined in zoominfo_parser and extractors/utils_data.py is truncated
+SRC_DIR = Path(__file__).resolve().parent
+
+# Template for URLs that fail to scrape; copied and filled in per failure.
+# List values are shared between copies and must not be mutated.
+_EMPTY_RECORD: Mapping[str, Any] = MappingProxyType(
+    {
+        "url": None,
+        "id": None,
+        "name": None,
+        "description": None,
+        "revenue": None,
+        "revenue_currency": None,
+        "stock_symbol": None,
+        "website": None,
+        "employees": None,
+        "industry": [],
+        "headquarters": None,
+        "phone_number": None,
+        "total_funding_amount": None,
+        "most_recent_funding_amount": None,
+        "funding_currency": None,
+        "funding_rounds": None,
+        "leadership": [],
+        "business_classification_codes": [],
+        "ceo_rating": None,
+        "enps_score": None,
+        "tech_stack": [],
+        "social_media": [],
+        "news_and_media": [],
+        "error": None,
+    }
+)
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -45,13 +76,7 @@ def read_urls(input_path: Path, logger: logging.Logger) -> List[str]:
         logger.error("Input profiles file not found at %s", input_path)
         raise FileNotFoundError(f"Input profiles file not found at {input_path}")
 
-    urls: List[str] = []
-    with input_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            urls.append(stripped)
+    urls = read_urls_from_file(str(input_path))
 
     if not urls:
         logger.warning("No URLs found in input file: %s", input_path)
@@ -84,46 +109,21 @@ def run() -> None:
     scraper = ZoomInfoCompanyScraper(settings=settings, logger=get_logger("zoominfo_scraper", log_level))
     exporter = JSONExporter(output_path)
 
-    all_results: List[Dict[str, Any]] = []
-
-    for idx, url in enumerate(urls, start=1):
-        root_logger.info("Processing %d/%d: %s", idx, len(urls), url)
-        try:
-            result = scraper.scrape_company(url)
-            all_results.append(result)
-        except Exception as exc:  # noqa: BLE001
-            root_logger.exception("Failed to scrape URL %s: %s", url, exc)
-            all_results.append(
-                {
-                    "url": url,
-                    "id": None,
-                    "name": None,
-                    "description": None,
-                    "revenue": None,
-                    "revenue_currency": None,
-                    "stock_symbol": None,
-                    "website": None,
-                    "employees": None,
-                    "industry": [],
-                    "headquarters": None,
-                    "phone_number": None,
-                    "total_funding_amount": None,
-                    "most_recent_funding_amount": None,
-                    "funding_currency": None,
-                    "funding_rounds": None,
-                    "leadership": [],
-                    "business_classification_codes": [],
-                    "ceo_rating": None,
-                    "enps_score": None,
-                    "tech_stack": [],
-                    "social_media": [],
-                    "news_and_media": [],
-                    "error": str(exc),
-                }
-            )
-
-    exporter.export(all_results)
-    root_logger.info("Scraping finished. %d records written to %s", len(all_results), output_path)
+    max_workers = int(settings.get("concurrency", 8))
+
+    # Records are streamed to disk in input order as soon as each one is ready
+    with exporter, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(scraper.scrape_company, url) for url in urls]
+        for idx, (url, future) in enumerate(zip(urls, futures), start=1):
+            try:
+                record = future.result()
+            except Exception as exc:  # noqa: BLE001
+                root_logger.exception("Failed to scrape URL %s: %s", url, exc)
+                record = {**_EMPTY_RECORD, "url": url, "error": str(exc)}
+            exporter.append(record)
+            root_logger.info("Processed %d/%d: %s", idx, len(urls), url)
+
+    root_logger.info("Scraping finished. %d records written to %s", len(urls), output_path)
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
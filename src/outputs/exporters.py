@@ -3,16 +3,22 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, Iterable, List
+from typing import IO, Any, Dict, Iterable, List, Optional
+
+import orjson
 
 from ..extractors.data_utils import ensure_directory, to_serializable
+from .json_exporter import encode_array_item
 
 logger = logging.getLogger(__name__)
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 class DataExporter:
     """
     Export company records into one or more file formats.
     Supported formats: json, csv.
+    Stream records with append() / close().
     """
 
     def __init__(
@@ -24,6 +30,12 @@ class DataExporter:
         self.output_dir = output_dir
         self.formats = [fmt.lower() for fmt in formats]
         self.filename_prefix = filename_prefix
+        self._timestamp: Optional[str] = None
+        self._json_file: Optional[IO[bytes]] = None
+        self._csv_file: Optional[IO[str]] = None
+        self._csv_writer: Any = None
+        self._csv_header: List[str] = []
+        self._count = 0
 
     def export(self, companies: List[Dict[str, Any]]) -> None:
         ensure_directory(self.output_dir)
@@ -35,16 +47,95 @@ class DataExporter:
         if "csv" in self.formats:
             self._export_csv(companies, timestamp)
 
+    def append(self, company: Dict[str, Any]) -> None:
+        """
+        Write one record to every configured format. Output files are created
+        on the first record, so a run that parses nothing leaves no files.
+
+        The CSV header is taken from the first record's keys; parsed records
+        all share the CompanyRecord fields, so later records fit it.
+        """
+        if self._timestamp is None:
+            ensure_directory(self.output_dir)
+            self._timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            if "json" in self.formats:
+                self._json_file = open(self._output_path("json"), "wb")
+                self._json_file.write(b"[")
+            if "csv" in self.formats:
+                self._csv_file = open(
+                    self._output_path("csv"), "w", encoding="utf-8", newline=""
+                )
+                self._csv_writer = csv.writer(self._csv_file)
+                self._csv_header = sorted(company)
+                self._csv_writer.writerow(self._csv_header)
+
+        if self._json_file is not None:
+            self._json_file.write(
+                encode_array_item(company, self._count, default=to_serializable)
+            )
+        if self._csv_writer is not None:
+            format_value = self._format_csv_value
+            self._csv_writer.writerow(
+                [format_value(company.get(key)) for key in self._csv_header]
+            )
+        self._count += 1
+
+    def flush(self) -> None:
+        """Push buffered streamed output to disk, e.g. between batches."""
+        for f in (self._json_file, self._csv_file):
+            if f is not None:
+                f.flush()
+
+    def close(self) -> None:
+        """Finish a streamed export and close its output files."""
+        if self._timestamp is None:
+            return
+        if self._json_file is not None:
+            self._json_file.write(b"\n]")
+            self._json_file.close()
+            logger.info(
+                "Exported %d records to JSON: %s",
+                self._count,
+                self._output_path("json"),
+            )
+        if self._csv_file is not None:
+            self._csv_file.close()
+            logger.info(
+                "Exported %d records to CSV: %s",
+                self._count,
+                self._output_path("csv"),
+            )
+        self._timestamp = None
+        self._json_file = self._csv_file = self._csv_writer = None
+        self._csv_header = []
+        self._count = 0
+
+    def __enter__(self) -> "DataExporter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _output_path(self, extension: str) -> str:
+        return os.path.join(
+            self.output_dir, f"{self.filename_prefix}_{self._timestamp}.{extension}"
+        )
+
     def _export_json(
         self, companies: List[Dict[str, Any]], timestamp: str
     ) -> None:
         path = os.path.join(
             self.output_dir, f"{self.filename_prefix}_{timestamp}.json"
         )
-        serializable = [to_serializable(c) for c in companies]
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(serializable, f, ensure_ascii=False, indent=2)
+            with open(path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        companies,
+                        default=to_serializable,
+                        option=_JSON_OPTIONS,
+                    )
+                )
             logger.info("Exported %d records to JSON: %s", len(companies), path)
         except OSError as exc:
             logger.error("Failed to write JSON output to %s: %s", path, exc)
@@ -67,14 +158,13 @@ class DataExporter:
         )
         try:
             with open(path, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=header_keys)
-                writer.writeheader()
-                for company in companies:
-                    row = {
-                        key: self._format_csv_value(company.get(key))
-                        for key in header_keys
-                    }
-                    writer.writerow(row)
+                writer = csv.writer(f)
+                writer.writerow(header_keys)
+                format_value = self._format_csv_value
+                writer.writerows(
+                    [format_value(company.get(key)) for key in header_keys]
+                    for company in companies
+                )
             logger.info("Exported %d records to CSV: %s", len(companies), path)
         except OSError as exc:
             logger.error("Failed to write CSV output to %s: %s", path, exc)
@@ -83,5 +173,5 @@ class DataExporter:
     @staticmethod
     def _format_csv_value(value: Any) -> Any:
         if isinstance(value, (list, dict)):
-            return json.dumps(to_serializable(value), ensure_ascii=False)
+            return json.dumps(value, ensure_ascii=False, default=to_serializable)
         return value
\ No newline at end of file
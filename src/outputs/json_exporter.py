@@ -1,18 +1,60 @@
-import json
 from pathlib import Path
-from typing import Any, Iterable, List, Dict
+from typing import Any, BinaryIO, Callable, Iterable, List, Dict, Optional
+
+import orjson
+
+_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def encode_array_item(
+    record: Any, index: int, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Encode one element of a streamed JSON array (after the opening ``[``),
+    laid out exactly as an indented orjson dump of the whole list places it.
+    """
+    body = orjson.dumps(record, default=default, option=_OPTIONS)
+    return (b",\n  " if index else b"\n  ") + body.replace(b"\n", b"\n  ")
 
 class JSONExporter:
     """
     Writes scraped company data into a JSON file.
+    Stream records with open() / append() / close().
     """
 
     def __init__(self, output_path: Path | str) -> None:
         self.output_path = Path(output_path).resolve()
+        self._file: Optional[BinaryIO] = None
+        self._count = 0
 
     def export(self, records: Iterable[Dict[str, Any]]) -> None:
         records_list: List[Dict[str, Any]] = list(records)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with self.output_path.open("w", encoding="utf-8") as f:
-            json.dump(records_list, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        self.output_path.write_bytes(orjson.dumps(records_list, option=_OPTIONS))
+
+    def open(self) -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.output_path.open("wb")
+        self._file.write(b"[")
+        self._count = 0
+
+    def append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            raise RuntimeError("JSONExporter.append() called before open()")
+        self._file.write(encode_array_item(record, self._count))
+        self._file.flush()
+        self._count += 1
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._file.write(b"\n]" if self._count else b"]")
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "JSONExporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
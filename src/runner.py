@@ -1,44 +1,139 @@
 import argparse
-import json
+import asyncio
+import codecs
+import functools
 import logging
+import multiprocessing
 import os
+import shelve
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, MutableMapping, Optional, Tuple, Union
 
-import requests
+import httpx
+import orjson
+from selectolax.lexbor import SelectolaxError
 
-# Ensure local src modules can be imported when running as `python src/runner.py`
-CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-if CURRENT_DIR not in sys.path:
-    sys.path.append(CURRENT_DIR)
-
-from extractors.data_utils import (  # type: ignore  # noqa: E402
+from .extractors.data_utils import (
+    canonicalize_url,
+    ensure_directory,
     read_urls_from_file,
 )
-from extractors.zoominfo_parser import ZoomInfoCompanyParser  # type: ignore  # noqa: E402
-from outputs.exporters import DataExporter  # type: ignore  # noqa: E402
+from .extractors.zoominfo_parser import ZoomInfoCompanyParser
+from .outputs.exporters import DataExporter
+
+# Run as a package module: `python -m src.runner`
+SRC_DIR = Path(__file__).resolve().parent
+
+_FETCH_LOGGER = logging.getLogger("runner.fetch_and_parse_company")
+_DEFAULT_ACCEPT = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+# httpx decodes all of these transparently; br needs the brotli extra
+_ACCEPT_ENCODING = "br, gzip, deflate"
+
+# Statuses retried with exponential backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+# Longest Retry-After delay honored, in seconds
+_MAX_RETRY_AFTER = 60.0
+
+# Failures a malformed page can raise inside parse_company; logged without a
+# traceback, while anything else is still reported as unexpected
+_PARSE_ERRORS = (
+    ValueError,
+    LookupError,
+    TypeError,
+    AttributeError,
+    SelectolaxError,
+)
+
+# Consecutive successful responses before the adaptive limit grows by one
+_AIMD_INCREASE_AFTER = 10
+
+# Upper bound on scheduled fetch tasks; the exporter is flushed this often too
+_BATCH_SIZE = 1000
+
+_DEFAULT_USER_AGENT = "ZoomInfoCompaniesScraper/1.0 (+https://bitbash.dev)"
 
-def load_settings(settings_path: Optional[str] = None) -> Dict[str, Any]:
+@dataclass(frozen=True, slots=True)
+class RequestCfg:
+    timeout: int = 15
+    concurrency: int = 5
+    max_concurrency: Optional[int] = None
+    user_agent: str = _DEFAULT_USER_AGENT
+    http_cache: bool = True
+
+@dataclass(frozen=True, slots=True)
+class OutputCfg:
+    directory: str = "../data"
+    formats: Tuple[str, ...] = ("json",)
+    filename_prefix: str = "zoominfo_companies"
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Typed, immutable view of the settings file. Missing keys take the
+    defaults above, so callers read attributes instead of chained .get()s.
+    """
+
+    request: RequestCfg = RequestCfg()
+    output: OutputCfg = OutputCfg()
+    logging_level: str = "INFO"
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "Settings":
+        # Slotted dataclass attributes are descriptors, so read defaults off
+        # instances rather than the classes
+        req, out = raw.get("request", {}), raw.get("output", {})
+        req_default, out_default = RequestCfg(), OutputCfg()
+        return cls(
+            request=RequestCfg(
+                timeout=int(req.get("timeout", req_default.timeout)),
+                concurrency=int(req.get("concurrency", req_default.concurrency)),
+                max_concurrency=(
+                    int(req["max_concurrency"])
+                    if req.get("max_concurrency") is not None
+                    else None
+                ),
+                user_agent=req.get("user_agent", req_default.user_agent),
+                http_cache=bool(req.get("http_cache", req_default.http_cache)),
+            ),
+            output=OutputCfg(
+                directory=out.get("directory", out_default.directory),
+                formats=tuple(out.get("formats", out_default.formats)),
+                filename_prefix=out.get(
+                    "filename_prefix", out_default.filename_prefix
+                ),
+            ),
+            logging_level=raw.get("logging", {}).get("level", "INFO"),
+        )
+
+@functools.lru_cache(maxsize=4)
+def load_settings(settings_path: Optional[str] = None) -> Settings:
     """
     Load settings.json if present; otherwise fall back to settings.example.json.
+    Results are cached per path; the returned Settings is immutable, so the
+    cached instance is safe to share.
     """
-    config_dir = os.path.join(CURRENT_DIR, "config")
+    config_dir = SRC_DIR / "config"
     if settings_path:
-        candidate_paths = [settings_path]
+        candidate_paths = [Path(settings_path)]
     else:
         candidate_paths = [
-            os.path.join(config_dir, "settings.json"),
-            os.path.join(config_dir, "settings.example.json"),
+            config_dir / "settings.json",
+            config_dir / "settings.example.json",
         ]
 
     for path in candidate_paths:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+        if path.exists():
+            with open(path, "rb") as f:
+                return Settings.from_dict(orjson.loads(f.read()))
 
     raise FileNotFoundError(
-        f"No configuration file found. Tried: {', '.join(candidate_paths)}"
+        f"No configuration file found. Tried: {', '.join(map(str, candidate_paths))}"
     )
 
 def configure_logging(level_name: str) -> None:
@@ -48,35 +143,262 @@ def configure_logging(level_name: str) -> None:
         format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
     )
 
-def fetch_and_parse_company(
+def _response_html(response: httpx.Response) -> Union[str, bytes]:
+    """
+    Return the body as raw bytes when it is UTF-8, so the parser can scan it
+    without materializing a decoded copy; other charsets are decoded here.
+    """
+    if codecs.lookup(response.encoding or "utf-8").name == "utf-8":
+        return response.content
+    return response.text
+
+class AdaptiveLimiter:
+    """
+    Async concurrency limit that adapts to the server (AIMD).
+
+    Works like a semaphore whose size moves between 1 and `maximum`: a 429
+    halves it, and every `_AIMD_INCREASE_AFTER` consecutive successful
+    responses raise it by one. Entering the limiter yields a ticket to pass
+    back to record().
+    """
+
+    def __init__(self, initial: int, maximum: int) -> None:
+        self.maximum = max(1, maximum)
+        self.limit = min(max(1, initial), self.maximum)
+        self._in_flight = 0
+        self._successes = 0
+        self._issued = 0
+        self._cut_after = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> int:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            self._issued += 1
+            return self._issued
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify(self.limit - self._in_flight)
+
+    def record(self, status_code: int, ticket: int) -> None:
+        """Adjust the limit from the response to the request holding `ticket`."""
+        if status_code == 429:
+            self._successes = 0
+            # A burst of 429s is one congestion event: requests issued before
+            # the last cut were sent at the old rate and don't cut again
+            if ticket > self._cut_after:
+                self.limit = max(1, self.limit // 2)
+                self._cut_after = self._issued
+        elif status_code < 400:
+            self._successes += 1
+            if self._successes >= _AIMD_INCREASE_AFTER:
+                self._successes = 0
+                if self.limit < self.maximum:
+                    self.limit += 1
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Exponential backoff for `attempt`, stretched to the server's Retry-After
+    (in seconds, capped at `_MAX_RETRY_AFTER`) when it asks for longer.
+    """
+    delay = _BACKOFF_FACTOR * (2**attempt)
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), _MAX_RETRY_AFTER))
+    return delay
+
+def _is_unchanged(response: httpx.Response, cached: Dict[str, Any]) -> bool:
+    """
+    True when a HEAD response carries the same validator as the cached entry.
+    The ETag wins when both sides have one; Last-Modified is the fallback.
+    """
+    etag = response.headers.get("ETag")
+    if etag and cached.get("etag"):
+        return etag == cached["etag"]
+    last_modified = response.headers.get("Last-Modified")
+    return bool(last_modified) and last_modified == cached.get("last_modified")
+
+async def fetch_and_parse_company(
     url: str,
-    session: requests.Session,
+    client: httpx.AsyncClient,
+    limiter: AdaptiveLimiter,
     parser: ZoomInfoCompanyParser,
-    timeout: int,
-    user_agent: str,
+    cache: Optional[MutableMapping[str, Dict[str, Any]]] = None,
+    parse_pool: Optional[Executor] = None,
 ) -> Optional[Dict[str, Any]]:
-    logger = logging.getLogger("runner.fetch_and_parse_company")
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
+    """
+    Fetch one company page and parse it on `parse_pool`, reusing the cached
+    record when the page is unchanged.
+    """
+    logger = _FETCH_LOGGER
+    # Shared headers live on the client; only conditional-GET validators are per call
+    headers: Optional[Dict[str, str]] = None
+    cached = cache.get(url) if cache is not None else None
+    if cached:
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
     try:
-        logger.debug(f"Requesting URL: {url}")
-        response = session.get(url, timeout=timeout, headers=headers)
-        if not response.ok:
+        logger.debug("Requesting URL: %s", url)
+        if cached:
+            # A HEAD with matching validators skips the GET; any HEAD failure
+            # falls through to the conditional GET, where a 304 also hits cache
+            try:
+                async with limiter as ticket:
+                    head = await client.head(url, follow_redirects=True)
+                    limiter.record(head.status_code, ticket)
+            except httpx.HTTPError as exc:
+                logger.debug("HEAD failed for %s: %s", url, exc)
+            else:
+                if head.is_success and _is_unchanged(head, cached):
+                    logger.info("Unchanged, using cached record for %s", url)
+                    return cached["parsed"]
+        for attempt in range(_MAX_RETRIES + 1):
+            # Each attempt takes its own slot, so backing off frees it
+            async with limiter as ticket:
+                response = await client.get(url, headers=headers)
+                limiter.record(response.status_code, ticket)
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        if response.status_code == 304 and cached:
+            logger.info("Not modified, using cached record for %s", url)
+            return cached["parsed"]
+        if not response.is_success:
             logger.warning(
                 "Failed to fetch URL %s: status_code=%s", url, response.status_code
             )
             return None
-        html = response.text
-        company = parser.parse_company(html, url)
-        logger.info("Parsed company '%s' from %s", company.get("name"), url)
-        return company
-    except requests.RequestException as exc:
-        logger.error("Network error while fetching %s: %s", url, exc)
+        html = _response_html(response)
+    except httpx.HTTPError as exc:
+        # Expected for unreachable hosts and timeouts; no traceback needed
+        logger.warning("Network error while fetching %s: %s", url, exc)
+        return None
     except Exception as exc:  # noqa: BLE001
         logger.exception("Unexpected error while processing %s: %s", url, exc)
-    return None
+        return None
+
+    # Parse after the limiter slot is released, off the event loop
+    loop = asyncio.get_running_loop()
+    try:
+        company = await loop.run_in_executor(
+            parse_pool, parser.parse_company, html, url
+        )
+    except _PARSE_ERRORS as exc:
+        logger.warning("Failed to parse %s: %s: %s", url, type(exc).__name__, exc)
+        return None
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Unexpected error while parsing %s: %s", url, exc)
+        return None
+
+    logger.info("Parsed company '%s' from %s", company.get("name"), url)
+    if cache is not None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "parsed": company,
+            }
+    return company
+
+async def scrape_companies(
+    urls: List[str],
+    parser: ZoomInfoCompanyParser,
+    exporter: DataExporter,
+    timeout: int,
+    concurrency: int,
+    user_agent: str,
+    cache_path: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+) -> int:
+    """
+    Fetch and parse every URL, handing each record to `exporter` in input
+    order. Returns the number of records exported.
+    """
+    logger = logging.getLogger("runner")
+    # A missing max_concurrency setting defaults the ceiling to `concurrency`
+    max_concurrency = max_concurrency or concurrency
+    limiter = AdaptiveLimiter(concurrency, max_concurrency)
+    # Over HTTP/2 all requests share one multiplexed connection; HTTP/1.1
+    # servers get a keep-alive pool sized to the highest possible limit
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=max_concurrency,
+            max_keepalive_connections=max_concurrency,
+        ),
+        retries=_MAX_RETRIES,
+    )
+    headers = {
+        "User-Agent": user_agent,
+        "Accept": _DEFAULT_ACCEPT,
+        "Accept-Encoding": _ACCEPT_ENCODING,
+    }
+    exported = 0
+    # Validators and parsed records, so unchanged pages are skipped next run
+    cache = shelve.open(cache_path) if cache_path else None
+    try:
+        # Pages are parsed in parallel, one worker per CPU. Workers start
+        # lazily inside the running loop, where resolver threads may be alive,
+        # so they come from a forkserver rather than a fork of this process
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("forkserver"),
+        ) as parse_pool:
+            async with httpx.AsyncClient(
+                transport=transport,
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=True,
+            ) as client:
+                def schedule(url: str) -> "asyncio.Future[Optional[Dict[str, Any]]]":
+                    return asyncio.ensure_future(
+                        fetch_and_parse_company(
+                            url, client, limiter, parser, cache, parse_pool
+                        )
+                    )
+
+                # Sliding window: at most _BATCH_SIZE tasks exist at a time,
+                # and a new URL is scheduled each time the oldest is drained,
+                # so no batch boundary waits on its slowest URL
+                url_iter = iter(urls)
+                pending: Deque[Tuple[str, "asyncio.Future[Any]"]] = deque()
+                for url in url_iter:
+                    pending.append((url, schedule(url)))
+                    if len(pending) == _BATCH_SIZE:
+                        break
+
+                drained = 0
+                with exporter:
+                    while pending:
+                        url, task = pending.popleft()
+                        next_url = next(url_iter, None)
+                        if next_url is not None:
+                            pending.append((next_url, schedule(next_url)))
+                        try:
+                            company = await task
+                        except Exception as exc:  # noqa: BLE001
+                            logger.error(
+                                "Error processing %s: %s", url, exc, exc_info=exc
+                            )
+                            company = None
+                        if company:
+                            exporter.append(company)
+                            exported += 1
+                        drained += 1
+                        if drained % _BATCH_SIZE == 0:
+                            exporter.flush()
+    finally:
+        if cache is not None:
+            cache.close()
+    return exported
 
 def run(
     input_file: str,
@@ -84,66 +406,57 @@ def run(
 ) -> int:
     settings = load_settings(config_path)
 
-    logging_level = settings.get("logging", {}).get("level", "INFO")
-    configure_logging(logging_level)
+    configure_logging(settings.logging_level)
     logger = logging.getLogger("runner")
 
-    request_cfg = settings.get("request", {})
-    timeout = int(request_cfg.get("timeout", 15))
-    concurrency = int(request_cfg.get("concurrency", 5))
-    user_agent = request_cfg.get(
-        "user_agent", "ZoomInfoCompaniesScraper/1.0 (+https://bitbash.dev)"
-    )
-
-    output_cfg = settings.get("output", {})
-    output_dir = os.path.normpath(
-        os.path.join(CURRENT_DIR, output_cfg.get("directory", "../data"))
-    )
-    formats = output_cfg.get("formats", ["json"])
-    filename_prefix = output_cfg.get("filename_prefix", "zoominfo_companies")
+    request_cfg = settings.request
+    output_cfg = settings.output
+    output_dir = os.path.normpath(SRC_DIR / output_cfg.directory)
 
     logger.info("Loading URLs from %s", input_file)
-    urls = read_urls_from_file(input_file)
+    urls = read_urls_from_file(input_file, unique=False)
     if not urls:
         logger.warning("No URLs found in %s. Nothing to do.", input_file)
         return 1
 
+    # Dedupe on the canonical form but fetch the first spelling as written
+    first_seen: Dict[str, str] = {}
+    for url in urls:
+        first_seen.setdefault(canonicalize_url(url), url)
+    loaded = len(urls)
+    urls = list(first_seen.values())
+    if len(urls) < loaded:
+        logger.info("Deduplicated %d URL(s).", loaded - len(urls))
+
     logger.info("Loaded %d URL(s). Starting scrape.", len(urls))
 
-    parser = ZoomInfoCompanyParser()
-    companies: List[Dict[str, Any]] = []
-
-    with requests.Session() as session:
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            future_to_url = {
-                executor.submit(
-                    fetch_and_parse_company,
-                    url,
-                    session,
-                    parser,
-                    timeout,
-                    user_agent,
-                ): url
-                for url in urls
-            }
+    cache_path: Optional[str] = None
+    if request_cfg.http_cache:
+        ensure_directory(output_dir)
+        cache_path = os.path.join(output_dir, ".http_cache")
 
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    result = future.result()
-                    if result:
-                        companies.append(result)
-                except Exception as exc:  # noqa: BLE001
-                    logger.exception("Error processing future for %s: %s", url, exc)
+    parser = ZoomInfoCompanyParser()
+    exporter = DataExporter(
+        output_dir, output_cfg.formats, output_cfg.filename_prefix
+    )
+    exported = asyncio.run(
+        scrape_companies(
+            urls,
+            parser,
+            exporter,
+            request_cfg.timeout,
+            request_cfg.concurrency,
+            request_cfg.user_agent,
+            cache_path,
+            request_cfg.max_concurrency,
+        )
+    )
 
-    if not companies:
+    if not exported:
         logger.warning("No companies parsed successfully.")
         return 1
 
-    exporter = DataExporter(output_dir, formats, filename_prefix)
-    exporter.export(companies)
-
-    logger.info("Scraping completed. Parsed %d company record(s).", len(companies))
+    logger.info("Scraping completed. Parsed %d company record(s).", exported)
     return 0
 
 def main() -> None:
@@ -153,7 +466,7 @@ def main() -> None:
     parser.add_argument(
         "--input",
         "-i",
-        default=os.path.normpath(os.path.join(CURRENT_DIR, "../data/input_urls.txt")),
+        default=str(SRC_DIR.parent / "data" / "input_urls.txt"),
         help="Path to input file containing one ZoomInfo company URL per line.",
     )
     parser.add_argument(